@@ -28,7 +28,10 @@ a = Analysis(
         'matplotlib',
         'matplotlib.backends.backend_tkagg',
         'pandas',
+        'scipy.spatial',
+        'xlsxwriter',
         'openpyxl',
+        'win32com.client',
         'customtkinter',
         'cv2',
     ] + easyocr_hiddenimports,
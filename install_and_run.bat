@@ -17,13 +17,13 @@ echo Installing required packages...
 echo.
 
 REM Install all required packages
-pip install numpy matplotlib customtkinter pillow easyocr pandas openpyxl --quiet
+pip install numpy matplotlib customtkinter pillow easyocr pandas scipy xlsxwriter openpyxl pywin32 --quiet
 
 if errorlevel 1 (
     echo.
     echo WARNING: Some packages may have failed to install.
     echo Trying alternative installation...
-    pip install numpy matplotlib pillow pandas openpyxl --quiet
+    pip install numpy matplotlib pillow pandas scipy xlsxwriter openpyxl pywin32 --quiet
     pip install easyocr --quiet
 )
 